@@ -1,6 +1,7 @@
 import base64
 import io
 from pathlib import Path
+from typing import BinaryIO
 import uuid
 import xml.etree.ElementTree as ET
 
@@ -33,6 +34,8 @@ class DrawioImageDesign(ImageProcessing):
         OSError: If font files cannot be loaded.
     """
 
+    __slots__ = ("_root", "_xml_root")
+
     def __init__(self, *args, **kwargs):
         """Initialize the DrawioImageDesign class with inherited image processing settings.
 
@@ -624,11 +627,12 @@ class DrawioImageDesign(ImageProcessing):
         """
         return f'<font face="{self._font_family}" style="color: {self._signature_label_color};">{label}</font>'  # noqa: E501
 
-    def export_to_drawio(self, file: str | Path, **kwargs):
+    def export_to_drawio(self, file: str | Path | BinaryIO, **kwargs):
         """Export the current image layout to a .drawio-compatible XML file.
 
         Args:
-            file (str | Path): Path to the output .drawio file.
+            file (str | Path | BinaryIO): Path to the output .drawio file or a binary
+                file object to write the XML into.
             **kwargs: Additional keyword arguments passed to `united_images()` 
                 (e.g., layout, spacing, grid_cols, grid_rows, width, height).
 
@@ -682,8 +686,9 @@ class DrawioImageDesign(ImageProcessing):
 
         Notes:
             - The resulting string can be embedded in XML or HTML as a data URI.
-            - Image is saved to an in-memory buffer before encoding.
+            - Image is saved to an in-memory buffer, which is encoded in place
+              through `getbuffer()` without copying the PNG bytes.
         """
         buffer = io.BytesIO()
         image.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode("ascii")
+        return base64.b64encode(buffer.getbuffer()).decode("ascii")
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import math
 from pathlib import Path
 
@@ -7,6 +9,12 @@ from science_helper.image_processing.enumerates import LabelMode, LayoutMode, Si
 from science_helper.image_processing.processing import ImageProcessing
 
 
+@lru_cache(maxsize=32)
+def _get_font(path: Path, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing already parsed font files of the same size."""
+    return ImageFont.truetype(path, size)
+
+
 class ImagesDesign(ImageProcessing):
     """Extended image composition class with support for layout, labels, borders, and axes.
 
@@ -18,6 +26,10 @@ class ImagesDesign(ImageProcessing):
     The user can control all aspects of the visualization via class parameters,
     including font style, position of labels, and layout dimensions.
 
+    Stored images are never modified: `preprocessing_image` always draws on a newly
+    allocated image (produced by the border/resize step), so images passed to
+    `append` or `__setitem__` are shared without defensive copies.
+
     Typical usage:
         design = ImagesDesign(images_path="path/to/images", signature=True, draw_axis=True)
         combined = design.united_images(layout="grid", spacing=20, grid_cols=3)
@@ -28,6 +40,8 @@ class ImagesDesign(ImageProcessing):
         ValueError: If configuration values are invalid or inconsistent.
     """
 
+    __slots__ = ("_axis_font", "_signature_font")
+
     def __init__(  # noqa: PLR0913
         self,
         images_path: str | Path,
@@ -103,7 +117,7 @@ class ImagesDesign(ImageProcessing):
     # Assistant methods
     def _load_fonts(self):
         try:
-            self._signature_font = ImageFont.truetype(
+            self._signature_font = _get_font(
                 self.FONT_FAMILY_PATH / f"{self._font_family}.ttf", self._signature_font_size
             )
         except OSError:
@@ -111,7 +125,7 @@ class ImagesDesign(ImageProcessing):
             self._signature_font = ImageFont.load_default()
 
         try:
-            self._axis_font = ImageFont.truetype(
+            self._axis_font = _get_font(
                 self.FONT_FAMILY_PATH / f"{self._font_family}.ttf", self._axis_font_size
             )
         except OSError:
@@ -129,7 +143,8 @@ class ImagesDesign(ImageProcessing):
         Returns:
             PIL.Image.Image: The image with a border applied, or the original image if no border is set.
         """  # noqa: E501
-        if self._border_size:
+        # Размер рамки хранится кортежем, поэтому (0, 0, 0, 0) проверяется явно
+        if any(self._border_size):
             return ImageOps.expand(image, border=self._border_size, fill=self._border_fill)
         return image
 
@@ -190,13 +205,13 @@ class ImagesDesign(ImageProcessing):
             label_y (str): Label text for the Y-axis.
 
         Returns:
-            PIL.Image.Image: A copy of the original image with drawn axes and labels.
+            PIL.Image.Image: The same image with drawn axes and labels.
 
         Notes:
             - The method uses `self.axis_font_size` and `self._font` to style the labels.
             - Axes are drawn in black with fixed dimensions (offset = 20, length = 60 pixels).
+            - The function modifies the image in-place; callers pass an already copied image.
         """  # noqa: E501
-        img = img.copy()
         draw = ImageDraw.Draw(img)
         w, h = img.size
 
@@ -351,10 +366,32 @@ class ImagesDesign(ImageProcessing):
             raise IndexError(f"Index {index} outside the range of the image list")
 
         self._load_fonts()
+        return self._decorate_image(index, width, height)
+
+    def _decorate_image(
+        self, index: int, width: int | None = None, height: int | None = None
+    ) -> Image.Image:
+        """Apply resizing, border, label and axes to a single image.
+
+        Fonts must already be loaded. Stored images are never modified, so the method
+        can be called for several images concurrently.
+
+        Args:
+            index (int): Index of the image in the internal image list.
+            width (int, optional): Target width for resizing.
+            height (int, optional): Target height for resizing.
+
+        Returns:
+            PIL.Image.Image: The processed image.
+        """
         img = self._images[index]
+        proc = img
         if width and height:
-            img = self._resize_proportional(img=img, width=width, height=height)
-        proc = self._draw_border(img)
+            proc = self._resize_proportional(img=img, width=width, height=height)
+        proc = self._draw_border(proc)
+        if proc is img:
+            # Дальнейшая отрисовка идёт на месте, исходное изображение не трогаем
+            proc = img.copy()
 
         if self._signature and self._signature_label:
             proc = self._add_numbering(proc, self._get_label(index))
@@ -413,9 +450,11 @@ class ImagesDesign(ImageProcessing):
         if not self._images:
             raise ValueError("The list of images is empty")
 
-        images = []
-        for i in range(len(self._images)):
-            proc = self.preprocessing_image(i, width=width, height=height)
-            images.append(proc)
+        self._load_fonts()
+        decorate = partial(self._decorate_image, width=width, height=height)
+        # Pillow отпускает GIL в операциях на C, поэтому потоки обрабатывают
+        # изображения параллельно; порядок результатов сохраняется
+        with ThreadPoolExecutor() as executor:
+            images = list(executor.map(decorate, range(len(self._images))))
 
         return self._layout_images(images, layout, spacing, bg_color, grid_cols, grid_rows)
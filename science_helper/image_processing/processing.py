@@ -1,10 +1,29 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
+import warnings
 
 from PIL import Image
 
 from science_helper.image_processing.enumerates import LabelMode, LayoutMode, SignaturePosition
 
 
+# Кортежи типов для isinstance: не собираем types.UnionType на каждом вызове
+_STR_OR_PATH = (str, Path)
+_TUPLE_OR_LIST = (tuple, list)
+_LABEL_TYPES = (str, tuple, LabelMode)
+_POSITION_TYPES = (SignaturePosition, str)
+_OFFSET_TYPES = (int, tuple)
+_STR_OR_LABEL_MODE = (str, LabelMode)
+
+# Порядок загрузки изображений: сначала png, затем jpg и jpeg
+_IMAGE_SUFFIXES = {".png": 0, ".jpg": 1, ".jpeg": 2}
+
+_VALID_LABEL_MODES = frozenset(m.value for m in LabelMode)
+_UNSET = object()
+
+
 def to_roman(n: int) -> str:
     """Convert an integer to its Roman numeral representation.
 
@@ -31,6 +50,20 @@ def to_roman(n: int) -> str:
     return roman
 
 
+def _open_image(path: Path) -> Image.Image:
+    """Open an image file and decode its pixel data immediately.
+
+    Args:
+        path (Path): Path to the image file.
+
+    Returns:
+        PIL.Image.Image: The fully loaded image.
+    """
+    img = Image.open(path)
+    img.load()
+    return img
+
+
 def get_label(index: int, mode: str | LabelMode = LabelMode.CYRILLIC_LOWER) -> str:
     """Return a label string based on the specified mode and index.
 
@@ -99,6 +132,31 @@ class ImageProcessing:
 
     FONT_FAMILY_PATH = Path("./scienceHelper/image_processing/fonts/")
 
+    __slots__ = (
+        "_axis_font_size",
+        "_axis_labels",
+        "_axis_length",
+        "_axis_offset",
+        "_axis_width",
+        "_border_fill",
+        "_border_size",
+        "_draw_axis",
+        "_font_family",
+        "_images",
+        "_images_path",
+        "_label_fn",
+        "_label_source",
+        "_pos_fn",
+        "_pos_key",
+        "_signature",
+        "_signature_color",
+        "_signature_font_size",
+        "_signature_label",
+        "_signature_label_color",
+        "_signature_pos",
+        "_signature_size",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         images_path: str | Path,
@@ -331,7 +389,7 @@ class ImageProcessing:
 
     @staticmethod
     def _validate_path(path):
-        if not isinstance(path, str | Path):
+        if not isinstance(path, _STR_OR_PATH):
             raise TypeError("images_path must be a str or Path")
         return Path(path)
 
@@ -339,7 +397,7 @@ class ImageProcessing:
     def _validate_border_size(border_size):
         if isinstance(border_size, int):
             return (border_size,) * 4
-        if isinstance(border_size, tuple | list) and len(border_size) == 4:  # noqa: PLR2004
+        if isinstance(border_size, _TUPLE_OR_LIST) and len(border_size) == 4:  # noqa: PLR2004
             return tuple(border_size)
         if border_size is None:
             return (0,) * 4
@@ -443,9 +501,11 @@ class ImageProcessing:
 
     @signature_label.setter
     def signature_label(self, value):
-        if not (isinstance(value, str | tuple | LabelMode) or value is None):
+        if not (isinstance(value, _LABEL_TYPES) or value is None):
             raise TypeError("signature_label must be str, tuple, LabelMode or None")
         self._signature_label = value
+        self._label_fn = self._compile_label_fn(value)
+        self._label_source = value
 
     @property
     def signature_label_color(self):
@@ -471,7 +531,7 @@ class ImageProcessing:
 
     @signature_pos.setter
     def signature_pos(self, value):
-        if not isinstance(value, SignaturePosition | str):
+        if not isinstance(value, _POSITION_TYPES):
             raise TypeError("signature_pos must be a SignaturePosition or string")
         self._signature_pos = value
 
@@ -543,7 +603,7 @@ class ImageProcessing:
 
     @axis_offset.setter
     def axis_offset(self, value):
-        if not isinstance(value, int | tuple):
+        if not isinstance(value, _OFFSET_TYPES):
             raise TypeError("axis_offset must be an integer")
         self._axis_offset = value
 
@@ -624,55 +684,105 @@ class ImageProcessing:
         self._font_family = self._validate_font_family(self.FONT_FAMILY_PATH, value)
 
     # Assistant methods
-    def _get_label(self, index):
-        valid_modes = {m.value for m in LabelMode}
+    @staticmethod
+    def _compile_label_fn(label_mode) -> Callable[[int], str]:
+        """Build a function returning the signature label for an image index.
+
+        The labeling strategy is resolved once per `signature_label` assignment,
+        so per-image label lookup is a single call.
+
+        Args:
+            label_mode (Union[str, Tuple[str], LabelMode, None]): The labeling strategy or labels.
 
-        label_mode = self._signature_label
-        if isinstance(label_mode, str | LabelMode) and (
-            getattr(label_mode, "value", label_mode) in valid_modes
+        Returns:
+            Callable[[int], str]: A function mapping an image index to its label.
+        """
+        if isinstance(label_mode, _STR_OR_LABEL_MODE) and (
+            getattr(label_mode, "value", label_mode) in _VALID_LABEL_MODES
         ):
-            label = get_label(index, label_mode)
-        elif isinstance(label_mode, tuple):
-            if index >= len(label_mode):
-                raise IndexError(
-                    f"The signature for the index {index} was not found in the transmitted tuple"
-                )
-            label = label_mode[index]
-        elif isinstance(label_mode, str):
-            label = label_mode
-        else:
+            return lambda index: get_label(index, label_mode)
+
+        if isinstance(label_mode, tuple):
+
+            def from_tuple(index):
+                if index >= len(label_mode):
+                    raise IndexError(
+                        f"The signature for the index {index} "
+                        "was not found in the transmitted tuple"
+                    )
+                return label_mode[index]
+
+            return from_tuple
+
+        if isinstance(label_mode, str):
+            return lambda _index: label_mode
+
+        def invalid(_index):
             raise ValueError(f"Incorrect signature format: {label_mode}")
 
-        return label
+        return invalid
 
-    def _get_positions(self, image_w: int, image_h: int) -> list | tuple:
-        rect_w, rect_h = self._signature_size
-        left, top, right, bottom = self._border_size
-        positions = {
-            "top-left": (left, top, left + rect_w, top + rect_h),
-            "top-right": (image_w - right - rect_w, top, image_w - right, top + rect_h),
-            "bottom-left": (left, image_h - bottom - rect_h, left + rect_w, image_h - bottom),
-            "bottom-right": (
-                image_w - right - rect_w,
-                image_h - bottom - rect_h,
-                image_w - right,
-                image_h - bottom,
-            ),
-        }
-
-        key = (
-            self._signature_pos.value
-            if isinstance(self._signature_pos, SignaturePosition)
-            else self._signature_pos
-        )
-        rect_position = positions.get(key)
+    def _get_label(self, index):
+        # _signature_label может быть присвоен напрямую, минуя сеттер
+        if getattr(self, "_label_source", _UNSET) is not self._signature_label:
+            self._label_fn = self._compile_label_fn(self._signature_label)
+            self._label_source = self._signature_label
+        return self._label_fn(index)
+
+    @staticmethod
+    def _compile_positions_fn(
+        signature_pos, border_size, signature_size
+    ) -> Callable[[int, int], tuple]:
+        """Build a function returning the label box coordinates for a given image size.
+
+        Everything except the image size is folded into the returned closure, so the
+        per-image call does no dict construction, tuple unpacking or enum coercion.
 
-        if not rect_position:
+        Args:
+            signature_pos (Union[str, SignaturePosition]): Corner where the label is drawn.
+            border_size (Tuple[int, int, int, int]): Border size as (left, top, right, bottom).
+            signature_size (Tuple[int, int]): Width and height of the label box.
+
+        Returns:
+            Callable[[int, int], tuple]: A function mapping `(image_w, image_h)` to
+                `(x0, y0, x1, y1)` of the label box.
+        """
+        rect_w, rect_h = signature_size
+        left, top, right, bottom = border_size
+        key = signature_pos.value if isinstance(signature_pos, SignaturePosition) else signature_pos
+
+        match key:
+            case "top-left":
+                rect_position = (left, top, left + rect_w, top + rect_h)
+                return lambda _image_w, _image_h: rect_position
+            case "top-right":
+                x_off, y1 = right + rect_w, top + rect_h
+                return lambda image_w, _image_h: (image_w - x_off, top, image_w - right, y1)
+            case "bottom-left":
+                y_off, x1 = bottom + rect_h, left + rect_w
+                return lambda _image_w, image_h: (left, image_h - y_off, x1, image_h - bottom)
+            case "bottom-right":
+                x_off, y_off = right + rect_w, bottom + rect_h
+                return lambda image_w, image_h: (
+                    image_w - x_off,
+                    image_h - y_off,
+                    image_w - right,
+                    image_h - bottom,
+                )
+
+        def invalid(_image_w, _image_h):
             raise ValueError(
                 "rect_corner должен быть одним из: top-left, top-right, bottom-left, bottom-right"
             )
 
-        return rect_position
+        return invalid
+
+    def _get_positions(self, image_w: int, image_h: int) -> list | tuple:
+        key = (self._signature_pos, self._border_size, self._signature_size)
+        if getattr(self, "_pos_key", _UNSET) != key:
+            self._pos_fn = self._compile_positions_fn(*key)
+            self._pos_key = key
+        return self._pos_fn(image_w, image_h)
 
     def _load_images(self, folder) -> list[Image.Image]:
         """Load all image files from the specified folder with supported extensions.
@@ -687,20 +797,32 @@ class ImageProcessing:
             List[PIL.Image.Image]: A list of loaded images.
 
         Notes:
-            - Only files with extensions "*.png", "*.jpg", "*.jpeg" (case-sensitive) are loaded.
+            - Only files with extensions "*.png", "*.jpg", "*.jpeg" (case-insensitive) are loaded.
+            - The folder is read in a single `os.scandir` pass. Images are ordered by
+              extension (png, then jpg, then jpeg) and then by filename.
             - If the folder is empty or contains no supported image formats, an empty list is returned.
             - The input path is internally converted to `Path` using `pathlib`.
+            - Images are decoded eagerly in a thread pool; `DecompressionBombWarning` is
+              suppressed since the input folder is trusted.
 
         Raises:
             FileNotFoundError: If the specified folder does not exist.
             PIL.UnidentifiedImageError: If an image file cannot be opened by PIL.
         """  # noqa: E501
         folder = Path(folder)
-        images = []
-        for ext in ("*.png", "*.jpg", "*.jpeg"):
-            images.extend([Image.open(p) for p in folder.glob(ext)])
-
-        return images
+        with os.scandir(folder) as entries:
+            found = []
+            for entry in entries:
+                rank = _IMAGE_SUFFIXES.get(os.path.splitext(entry.name)[1].lower())
+                if rank is not None and entry.is_file():
+                    found.append((rank, entry.name, entry.path))
+        # Порядок os.scandir не определен, поэтому файлы сортируются по расширению и имени
+        paths = [Path(path) for _, _, path in sorted(found)]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(_open_image, paths))
 
     def _resize_proportional(
         self, img: Image.Image, width: int | None = None, height: int | None = None
@@ -751,6 +873,10 @@ class ImageProcessing:
             raise TypeError("The value must be an instance of PIL.Image.Image")
         self._images.append(image)
 
+    def clear(self) -> None:
+        """Remove all images from the internal image list."""
+        self._images.clear()
+
     def _draw_border(self):
         pass
 
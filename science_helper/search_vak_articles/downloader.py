@@ -1,11 +1,17 @@
+import asyncio
 import configparser
+import contextlib
+import json
+import os
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
+import aiohttp
 from fake_useragent import UserAgent
-import requests
+import orjson
 
 from science_helper.search_vak_articles.pdf_parser import save_to_json
+from science_helper.search_vak_articles.session import create_session
 
 
 class PDFDownloader:
@@ -13,21 +19,266 @@ class PDFDownloader:
 
     This class supports:
     - Downloading a PDF file from a URL if it does not already exist.
+    - Downloading several PDF files concurrently over a shared connection pool.
     - Automatically updating a configuration file with the latest downloaded filename.
-    - Fetching JSON data from a URL and saving it to a local `.json` file.
+    - Fetching JSON data from a URL and saving it to a local `.json` file, either on its
+      own or together with a batch of PDF downloads.
+
+    HTTP connections for JSON requests are kept alive in a shared session; use the
+    instance as a context manager or call `close()` to release them.
     """
 
-    def __init__(self, output_dir: str = ".", config_path: str = "config.ini", timeout: int = 60):
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        output_dir: str = ".",
+        config_path: str = "config.ini",
+        timeout: int = 60,
+        verify: bool = False,
+    ):
         """Initialize the PDF downloader instance.
 
         Args:
             output_dir (str): Directory where files will be saved. Defaults to the current directory.
             config_path (str): Path to the configuration INI file. Defaults to "config.ini".
-            timeout (int): Timeout in seconds for HTTP requests. Defaults to 60.
+            timeout (int): Timeout in seconds for connecting and for each read of HTTP
+                requests; the whole transfer is not limited. Defaults to 60.
+            verify (bool): Whether to validate TLS certificates of the remote servers.
+                Defaults to False.
         """  # noqa: E501
         self.output_dir = Path(output_dir)
         self.config_path = config_path
         self.timeout = timeout
+        self.verify = verify
+        self._user_agent = UserAgent(os="Linux")
+        self._config = configparser.ConfigParser()
+        self._config.read(self.config_path, encoding="utf-8")
+        self._config_dirty = False
+        self._session = create_session()
+
+    def __enter__(self):
+        """Return the downloader itself for use in a `with` block."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the HTTP session when leaving a `with` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Write pending configuration changes and release pooled HTTP connections."""
+        self._flush_config()
+        self._session.close()
+
+    @staticmethod
+    def _filename_from_url(url: str) -> str:
+        """Build the PDF filename from the `name` query parameter of the URL.
+
+        Args:
+            url (str): A URL containing a `name` query parameter.
+
+        Returns:
+            str: The filename in the form `<name>.pdf`.
+
+        Raises:
+            ValueError: If the `name` parameter is missing in the URL.
+        """
+        params = parse_qs(urlparse(url).query)
+        name = params.get("name", [None])[0]
+        if not name:
+            raise ValueError("URL не содержит параметра ?name=...")
+        return f"{name}.pdf"
+
+    def _save_filename(self, filename: str) -> None:
+        """Store the latest downloaded filename in the `[DIRECTORY]` config section.
+
+        The value is updated in memory only; the file is written by `_flush_config`,
+        which runs after each batch and on `close()`.
+
+        Args:
+            filename (str): Name of the downloaded PDF file.
+        """
+        directory = self._config["DIRECTORY"]
+        if directory.get("filename") == filename:
+            return
+        directory["filename"] = filename
+        self._config_dirty = True
+
+    def _flush_config(self) -> None:
+        """Write the configuration file if it has unsaved changes.
+
+        The file is written to a temporary sibling and moved into place with
+        `os.replace`, so the configuration is never left truncated.
+        """
+        if not self._config_dirty:
+            return
+        tmp_path = f"{self.config_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            self._config.write(f)
+        os.replace(tmp_path, self.config_path)
+        self._config_dirty = False
+
+    def _existing_files(self) -> set[str]:
+        """Return the names of regular files in `output_dir` using a single directory scan."""
+        try:
+            with os.scandir(self.output_dir) as it:
+                return {entry.name for entry in it if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    async def _download_one(
+        self, session: aiohttp.ClientSession, url: str, existing: set[str]
+    ) -> Path:
+        """Download a single PDF file using the given session if it is not already downloaded.
+
+        The response body is streamed to a temporary `.part` file, which is renamed
+        to the target name only after the download completes. When the server reports
+        `Content-Length`, disk space for the file is reserved up front.
+
+        Args:
+            session (aiohttp.ClientSession): An open session to issue the request with.
+            url (str): A URL pointing to a downloadable PDF, containing a `name` query parameter.
+            existing (set[str]): Names of the files already present in `output_dir`.
+
+        Returns:
+            Path: Path to the downloaded or existing PDF file.
+
+        Raises:
+            ValueError: If the `name` parameter is missing in the URL.
+            aiohttp.ClientResponseError: If the HTTP request fails.
+        """
+        filename = self._filename_from_url(url)
+        filepath = self.output_dir / filename
+
+        if filename in existing:
+            print(f"[✓] Файл уже существует: {filepath}")
+            return filepath
+
+        headers = {"User-Agent": self._user_agent.random}
+        tmp_path = filepath.with_name(f"{filepath.name}.part")
+        async with session.get(url, headers=headers) as resp:
+            resp.raise_for_status()
+            with tmp_path.open("wb") as f:
+                size = resp.content_length
+                if size and hasattr(os, "posix_fallocate"):
+                    # Место резервируется заранее; не все ФС это поддерживают
+                    with contextlib.suppress(OSError):
+                        os.posix_fallocate(f.fileno(), 0, size)
+                async for chunk in resp.content.iter_chunked(self.CHUNK_SIZE):
+                    f.write(chunk)
+                # Отбрасываем лишнее, если тело оказалось короче Content-Length
+                f.truncate()
+        tmp_path.replace(filepath)
+        print(f"[↓] Скачано: {filepath}")
+        return filepath
+
+    async def _fetch_json(self, session: aiohttp.ClientSession, url: str, output_file: str) -> None:
+        """Fetch JSON data using the given session and save it, like `dict_from_web`.
+
+        The response body is checked and written to disk as is, without re-encoding;
+        both steps run in a worker thread.
+
+        Args:
+            session (aiohttp.ClientSession): An open session to issue the request with.
+            url (str): A URL that returns JSON content.
+            output_file (str): Filename for the output JSON file. ".json" extension will be appended if missing.
+
+        Raises:
+            aiohttp.ClientResponseError: If the HTTP request fails.
+            orjson.JSONDecodeError: If the response body is not valid JSON.
+        """  # noqa: E501
+        out_path = self._json_path(output_file)
+        headers = self._conditional_headers(out_path)
+        async with session.get(url, headers=headers) as resp:
+            if resp.status == 304:  # noqa: PLR2004
+                print(f"[✓] Файл не изменился: {out_path}")
+                return
+            resp.raise_for_status()
+            if resp.status == 200:  # noqa: PLR2004
+                body = await resp.read()
+                await asyncio.to_thread(self._store_json, out_path, body, resp.headers)
+
+    def _store_json(self, path: Path, body: bytes, headers) -> None:
+        """Write a raw JSON response body and its cache validators next to each other.
+
+        The body is validated first, then written to a temporary sibling and moved
+        into place with `os.replace`, so a bad response never replaces a good file.
+
+        Args:
+            path (Path): Path to the output JSON file.
+            body (bytes): Response body.
+            headers (Mapping[str, str]): Response headers of the request.
+
+        Raises:
+            orjson.JSONDecodeError: If the body is not valid JSON.
+        """
+        orjson.loads(body)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, path)
+        self._save_validators(path, headers)
+
+    async def download_many(
+        self, urls: list[str], json_sources: dict[str, str] | None = None
+    ) -> list[Path]:
+        """Download several PDF files and, optionally, JSON files concurrently.
+
+        All requests share one `aiohttp.ClientSession`, so connections to the same host
+        are kept alive and reused. A failed request does not cancel the others: errors
+        are reported per source once the batch completes, and then the first one is
+        raised. If all PDFs were downloaded, the `[DIRECTORY]` section of the configuration
+        file is updated once with the filename of the last URL, even if a JSON source failed.
+
+        The files are written from the running event loop; call this method from a
+        worker thread (for example through `asyncio.run`) when the loop must stay responsive.
+
+        Args:
+            urls (list[str]): URLs pointing to downloadable PDFs, each containing a `name` query parameter.
+            json_sources (dict[str, str] | None): Output filenames mapped to URLs returning JSON.
+                Each one is fetched and saved as with `dict_from_web`.
+
+        Returns:
+            list[Path]: Paths to the downloaded or existing PDF files, in the order of `urls`.
+
+        Raises:
+            ValueError: If the `name` parameter is missing in any URL or a JSON
+                response is not valid JSON.
+            aiohttp.ClientError: If any request fails. PDF errors are raised first.
+        """  # noqa: E501
+        json_sources = json_sources or {}
+        if not urls and not json_sources:
+            return []
+
+        existing = self._existing_files()
+        connector = aiohttp.TCPConnector(limit=16, ssl=self.verify)
+        # Как и в requests, ограничено ожидание соединения и данных; вся загрузка не ограничена
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=self.timeout, sock_read=self.timeout
+        )
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._download_one(session, url, existing) for url in urls),
+                *(self._fetch_json(session, url, name) for name, url in json_sources.items()),
+                return_exceptions=True,
+            )
+
+        # Ошибка одного источника не прерывает загрузку остальных
+        sources = [*urls, *json_sources.values()]
+        for source, result in zip(sources, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"[✗] Ошибка загрузки {source}: {type(result).__name__}: {result}")
+
+        paths = list(results[: len(urls)])
+        for result in paths:
+            if isinstance(result, BaseException):
+                raise result
+        if paths:
+            self._save_filename(paths[-1].name)
+            self._flush_config()
+        for result in results[len(urls) :]:
+            if isinstance(result, BaseException):
+                raise result
+        return paths
 
     def download_pdf_if_needed(self, url: str) -> Path:
         """Download a PDF file from the URL if it is not already downloaded.
@@ -36,6 +287,9 @@ class PDFDownloader:
         If the file already exists, it will not be downloaded again.
         The method also updates the `[DIRECTORY]` section in the configuration file with the new filename.
 
+        This is a synchronous wrapper around `download_many` and must not be called
+        from a running event loop (use `asyncio.to_thread` or `download_many` instead).
+
         Args:
             url (str): A URL pointing to a downloadable PDF, containing a `name` query parameter.
 
@@ -44,37 +298,68 @@ class PDFDownloader:
 
         Raises:
             ValueError: If the `name` parameter is missing in the URL.
-            requests.HTTPError: If the HTTP request fails.
+            aiohttp.ClientResponseError: If the HTTP request fails.
         """  # noqa: E501
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-        name = params.get("name", [None])[0]
-        if not name:
-            raise ValueError("URL не содержит параметра ?name=...")
+        return asyncio.run(self.download_many([url]))[0]
 
-        filename = f"{name}.pdf"
-        filepath = self.output_dir / filename
+    def _json_path(self, output_file: str) -> Path:
+        """Return the path in `output_dir` for a JSON file, appending ".json" if missing."""
+        if not output_file.endswith(".json"):
+            output_file += ".json"
+        return self.output_dir / output_file
 
-        if filepath.exists():
-            print(f"[✓] Файл уже существует: {filepath}")
-        else:
-            headers = {"User-Agent": UserAgent(os="Linux").random}
-            resp = requests.get(url, headers=headers, timeout=self.timeout, verify=False)
-            resp.raise_for_status()
-            filepath.write_bytes(resp.content)
-            print(f"[↓] Скачано: {filepath}")
+    @staticmethod
+    def _meta_path(path: Path) -> Path:
+        """Return the path of the sidecar file holding HTTP cache validators for `path`."""
+        return path.with_name(f"{path.name}.meta.json")
 
-        config = configparser.ConfigParser()
-        config.read(self.config_path, encoding="utf-8")
-        config["DIRECTORY"]["filename"] = filename
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            config.write(f)
+    def _conditional_headers(self, path: Path) -> dict[str, str]:
+        """Build `If-None-Match` / `If-Modified-Since` headers for a previously saved file.
 
-        return filepath
+        Args:
+            path (Path): Path to the locally saved file.
+
+        Returns:
+            dict[str, str]: Conditional request headers, empty if the file or its
+                sidecar metadata is missing.
+        """
+        meta_path = self._meta_path(path)
+        if not (path.exists() and meta_path.exists()):
+            return {}
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _save_validators(self, path: Path, headers) -> None:
+        """Store the `ETag` and `Last-Modified` response headers next to the saved file.
+
+        Args:
+            path (Path): Path to the saved file.
+            headers (Mapping[str, str]): Response headers of the request.
+        """
+        meta = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+        meta_path = self._meta_path(path)
+        if any(meta.values()):
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        else:
+            meta_path.unlink(missing_ok=True)
 
     def dict_from_web(self, url: str, output_file: str) -> None:
         """Fetch JSON data from the given URL and save it to a `.json` file.
 
+        The server's `ETag` / `Last-Modified` values are stored in a `.meta.json` sidecar
+        file. On the next call they are sent as `If-None-Match` / `If-Modified-Since`,
+        and a `304 Not Modified` response leaves the existing file untouched.
+
         Args:
             url (str): A URL that returns JSON content.
             output_file (str): Filename for the output JSON file. ".json" extension will be appended if missing.
@@ -82,9 +367,17 @@ class PDFDownloader:
         Raises:
             requests.RequestException: If the request fails or times out.
         """  # noqa: E501
-        if not output_file.endswith(".json"):
-            output_file += ".json"
+        out_path = self._json_path(output_file)
 
-        r = requests.get(url, timeout=self.timeout, verify=False)
+        r = self._session.get(
+            url,
+            headers=self._conditional_headers(out_path),
+            timeout=self.timeout,
+            verify=self.verify,
+        )
+        if r.status_code == 304:  # noqa: PLR2004
+            print(f"[✓] Файл не изменился: {out_path}")
+            return
         if r.status_code == 200:  # noqa: PLR2004
-            save_to_json(r.json(), self.output_dir / output_file)
+            save_to_json(r.json(), out_path)
+            self._save_validators(out_path, r.headers)
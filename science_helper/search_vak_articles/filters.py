@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 
@@ -11,7 +12,23 @@ def fizbuz(spec_line: str, targets: list[str]) -> bool:
     Returns:
         bool: True if the spec_line starts with any of the target values, False otherwise.
     """
-    return any(spec_line.startswith(t) for t in targets)
+    return spec_line.startswith(tuple(targets))
+
+
+@lru_cache(maxsize=32)
+def _prepare_targets(targets: tuple[str, ...]) -> tuple[str, ...] | None:
+    """Normalize target prefixes for `filter_rows_by_specialty`.
+
+    Args:
+        targets (tuple[str, ...]): Specialty prefixes to filter by.
+
+    Returns:
+        tuple[str, ...] | None: The prefixes as a tuple, or None if no filtering
+            should be applied (empty targets or "all" among them).
+    """
+    if not targets or "all" in {t.lower() for t in targets}:
+        return None
+    return targets
 
 
 def filter_rows_by_specialty(
@@ -29,6 +46,8 @@ def filter_rows_by_specialty(
     Returns:
         list[dict[str, Any]]: Filtered list of rows where at least one specialty matches any target prefix.
     """  # noqa: E501
-    if not targets or any(t.lower() == "all" for t in targets):
+    prefixes = _prepare_targets(tuple(targets))
+    if prefixes is None:
         return rows
-    return [r for r in rows if any(fizbuz(sp, targets) for sp in r["specialties"])]
+    # str.startswith принимает кортеж и проверяет все префиксы за один вызов на C
+    return [r for r in rows if any(sp.startswith(prefixes) for sp in r["specialties"])]
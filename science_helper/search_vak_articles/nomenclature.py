@@ -1,5 +1,6 @@
-from bs4 import BeautifulSoup
-import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+from science_helper.search_vak_articles.session import create_session
 
 
 class NomenclatureParser:
@@ -8,6 +9,9 @@ class NomenclatureParser:
     This class is designed to download and parse a nomenclature table from a specified URL
     and convert it into a structured list of dictionaries.
 
+    HTTP connections are kept alive in a shared session; use the instance as a
+    context manager or call `close()` to release them.
+
     Attributes:
         timeout (int): Timeout in seconds for HTTP requests.
     """
@@ -19,15 +23,63 @@ class NomenclatureParser:
             timeout (int, optional): Timeout in seconds for HTTP requests. Defaults to 60.
         """
         self.timeout = timeout
+        self._session = create_session()
+
+    def __enter__(self):
+        """Return the parser itself for use in a `with` block."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the HTTP session when leaving a `with` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def fetch_html(self, url: str) -> str | None:
+        """Download the HTML page with the nomenclature table.
+
+        Args:
+            url (str): The URL of the page containing the HTML table.
+
+        Returns:
+            str | None: The page text, or None if the request was not successful.
+        """
+        r = self._session.get(url=url, timeout=self.timeout, verify=False)
+        if r.status_code != 200:  # noqa: PLR2004
+            return None
+        return r.text
+
+    def get_specialties(self, url: str) -> list[dict]:
+        """Download the HTML page from the given URL and extract specialties structure.
 
-    def get_specialties(self, url: str) -> list[dict]:  # noqa: C901
-        """Parse the HTML page from the given URL to extract specialties structure.
+        This is a shortcut for `fetch_html` followed by `parse_specialties`.
+
+        Args:
+            url (str): The URL of the page containing the HTML table.
+
+        Returns:
+            list[dict]: Categories with subcategories and their values, see
+                `parse_specialties`. Empty if the request fails.
+        """
+        html = self.fetch_html(url)
+        if html is None:
+            return []
+        return self.parse_specialties(html)
+
+    @staticmethod
+    def parse_specialties(html: str) -> list[dict]:
+        """Parse the HTML page to extract specialties structure.
 
         The expected structure is a table with merged cells (rowspan) representing
         category names, subcategories, and nested specialty values.
 
+        The method does not touch the HTTP session, so it can be run in a separate
+        process.
+
         Args:
-            url (str): The URL of the page containing the HTML table.
+            html (str): Text of the page containing the HTML table.
 
         Returns:
             list[dict]: A list of dictionaries representing categories with subcategories
@@ -47,49 +99,51 @@ class NomenclatureParser:
                         ]
 
         Notes:
-            - Returns an empty list if the request fails or the table is not found.
+            - Returns an empty list if the table is not found.
             - The parser assumes a specific structure with 2 to 4 columns per row.
         """
-        r = requests.get(url=url, timeout=self.timeout, verify=False)
-        if r.status_code != 200:  # noqa: PLR2004
-            return []
-
         output = []
         current_main, current_sub = None, None
 
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer("table"))
         table = soup.find("table")
         if not table:
             return []
 
         rows = table.find_all("tr")
         for row in rows[1:]:
-            cells = row.find_all("td")
+            cells = row.find_all("td", recursive=False)
             if not cells:
                 continue
 
+            # Текст и наличие rowspan извлекаются один раз на ячейку
+            texts = [c.get_text(strip=True) for c in cells]
+            has_rs = [c.has_attr("rowspan") for c in cells]
+
             if len(cells) == 4:  # noqa: PLR2004
-                if cells[0].has_attr("rowspan"):
-                    current_main = cells[0].get_text(strip=True)
+                if has_rs[0]:
+                    current_main = texts[0]
                     output.append({"category_name": current_main, "sub_category": []})
-                if cells[1].has_attr("rowspan"):
-                    current_sub = cells[1].get_text(strip=True)
-                    output[-1]["sub_category"].append(
-                        {"subcategory_name": current_sub, "values": [cells[2].get_text(strip=True)]}
+                cat = output[-1]
+                if has_rs[1]:
+                    current_sub = texts[1]
+                    cat["sub_category"].append(
+                        {"subcategory_name": current_sub, "values": [texts[2]]}
                     )
                 else:
-                    output[-1]["sub_category"][-1]["values"].append(cells[2].get_text(strip=True))
+                    cat["sub_category"][-1]["values"].append(texts[2])
 
             elif len(cells) == 3:  # noqa: PLR2004
-                if cells[0].has_attr("rowspan"):
-                    current_sub = cells[0].get_text(strip=True)
-                    output[-1]["sub_category"].append(
-                        {"subcategory_name": current_sub, "values": [cells[1].get_text(strip=True)]}
+                cat = output[-1]
+                if has_rs[0]:
+                    current_sub = texts[0]
+                    cat["sub_category"].append(
+                        {"subcategory_name": current_sub, "values": [texts[1]]}
                     )
                 else:
-                    output[-1]["sub_category"][-1]["values"].append(cells[1].get_text(strip=True))
+                    cat["sub_category"][-1]["values"].append(texts[1])
 
             elif len(cells) == 2:  # noqa: PLR2004
-                output[-1]["sub_category"][-1]["values"].append(cells[0].get_text(strip=True))
+                output[-1]["sub_category"][-1]["values"].append(texts[0])
 
         return output
@@ -1,13 +1,61 @@
-import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+import math
+import multiprocessing
+import os
 import pathlib
 import re
 from typing import Any
 
-import PyPDF2
+import orjson
+import pypdfium2 as pdfium
 
 from science_helper.utils.setting import RE_DATE, RE_ISSN_RAW, RE_ROW_START, RE_SPEC_CODE
 
 
+# Вспомогательные регулярные выражения и таблицы замены
+_ISSN_DASH = re.compile(r"[\-‑–—−]")
+_ISSN_SPACED_DASH = re.compile(r"\s*-\s*")
+_MULTI_WS = re.compile(r"\s{2,}")
+_ISSN_TRANS = str.maketrans({"Х": "X", "х": "x"})
+_CTRL_TRANS = str.maketrans({"\r": "", "\n": " "})
+# IGNORECASE относится только к дате, как и в исходном RE_DATE
+_DATE_OR_ISSN = re.compile(f"(?i:{RE_DATE.pattern})|(?:{RE_ISSN_RAW.pattern})")
+
+# Пороги, ниже которых накладные расходы пула процессов не окупаются
+_PARALLEL_MIN_PAGES = 16
+_PARALLEL_MIN_SECTIONS = 512
+_SECTIONS_CHUNKSIZE = 64
+
+# Кэш load_json: путь -> ((mtime_ns, size), данные)
+_JSON_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def _page_text(pdf: pdfium.PdfDocument, index: int) -> str:
+    """Extract the text of a single PDF page with carriage returns removed."""
+    return pdf[index].get_textpage().get_text_range().replace("\r", "")
+
+
+def _extract_pages(path: pathlib.Path, start: int, stop: int) -> list[str]:
+    """Extract text from a contiguous range of PDF pages.
+
+    Module-level so that it can be dispatched to a process pool.
+
+    Args:
+        path (Path): Path to the PDF file.
+        start (int): Index of the first page to extract.
+        stop (int): Index after the last page to extract.
+
+    Returns:
+        list[str]: Text of each page with carriage returns removed.
+    """
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return [_page_text(pdf, i) for i in range(start, stop)]
+    finally:
+        pdf.close()
+
+
 class PDFParser:
     """Parses a structured PDF file containing journal metadata such as title, ISSN, and specialties.
 
@@ -26,29 +74,63 @@ class PDFParser:
         """
         self.path = pathlib.Path(path)
 
-    def _read_pdf_text(self) -> str:
-        """Read and extract all text content from the PDF file.
+    def _iter_pages(self, executor: Executor | None = None) -> Iterator[str]:
+        """Extract the text of the PDF file page by page.
 
-        Returns:
-            str: Combined text from all pages of the PDF with normalized line endings.
-        """
-        reader = PyPDF2.PdfReader(self.path)
-        return "\n".join(page.extract_text() or "" for page in reader.pages).replace("\r", "")
+        Carriage returns are stripped per page. If an executor is given and the document
+        is large enough, contiguous page ranges are extracted in parallel and yielded
+        in page order.
+
+        Args:
+            executor (Executor | None): Pool used for parallel page extraction.
 
-    def _split_sections(self, raw: str) -> list[str]:
-        """Split the raw text into sections using a regular expression pattern.
+        Yields:
+            str: Text of each page of the PDF with normalized line endings.
+        """
+        pdf = pdfium.PdfDocument(self.path)
+        try:
+            n_pages = len(pdf)
+            if executor is None or n_pages < _PARALLEL_MIN_PAGES:
+                for i in range(n_pages):
+                    yield _page_text(pdf, i)
+                return
+        finally:
+            pdf.close()
+
+        step = math.ceil(n_pages / (os.cpu_count() or 1))
+        starts = range(0, n_pages, step)
+        stops = [min(start + step, n_pages) for start in starts]
+        for chunk in executor.map(_extract_pages, [self.path] * len(starts), starts, stops):
+            yield from chunk
+
+    def _iter_sections(self, pages: Iterable[str]) -> Iterator[str]:
+        """Split the page texts into sections using a regular expression pattern.
 
         Each section is assumed to start with a recognizable numeric identifier
-        based on the `RE_ROW_START` pattern.
+        based on the `RE_ROW_START` pattern. Pages are joined with newlines into a
+        rolling buffer: completed sections are yielded as soon as the next one starts,
+        and only the last, possibly unfinished, section is kept between pages.
 
         Args:
-            raw (str): Raw text extracted from the PDF.
+            pages (Iterable[str]): Text of consecutive PDF pages.
 
-        Returns:
-            list[str]: List of text segments corresponding to logical journal entries.
+        Yields:
+            str: Text segments corresponding to logical journal entries.
         """
-        idx = [m.start() for m in RE_ROW_START.finditer(raw)] + [len(raw)]
-        return [raw[idx[i] : idx[i + 1]] for i in range(len(idx) - 1)]
+        buf = None
+        for page in pages:
+            buf = page if buf is None else f"{buf}\n{page}"
+            prev = None
+            for m in RE_ROW_START.finditer(buf):
+                start = m.start()
+                if prev is not None:
+                    yield buf[prev:start]
+                prev = start
+            # Последняя секция может продолжиться на следующей странице
+            if prev is not None:
+                buf = buf[prev:]
+        if buf is not None and RE_ROW_START.match(buf):
+            yield buf
 
     def _normalize_issn(self, raw: str) -> str:
         """Normalize ISSN text to a consistent format (uppercase, hyphenated).
@@ -59,9 +141,8 @@ class PDFParser:
         Returns:
             str: Normalized ISSN string.
         """
-        raw = raw.replace("Х", "X").replace("х", "x")
-        raw = re.sub(r"[\-‑–—−]", "-", raw)
-        raw = re.sub(r"\s*-\s*", "-", raw)
+        raw = raw.translate(_ISSN_TRANS)
+        raw = _ISSN_SPACED_DASH.sub("-", _ISSN_DASH.sub("-", raw))
         return raw.upper()
 
     def _split_specialties(self, tail: str) -> list[str]:
@@ -85,7 +166,7 @@ class PDFParser:
                 raw_parts.append(tail[start:end].strip().lstrip(",; )"))
         for seg in raw_parts:
             cleaned_seg = seg.replace(",", " ")
-            cleaned_seg = re.sub(r"\s{2,}", " ", cleaned_seg)
+            cleaned_seg = _MULTI_WS.sub(" ", cleaned_seg)
             if cleaned_seg:
                 specs.append(cleaned_seg)
         return specs
@@ -104,7 +185,7 @@ class PDFParser:
                 - "specialties": List of specialty codes (if present)
             Returns None if the section is not properly formatted.
         """
-        clean = sec.replace("\r", "").replace("\n", " ")
+        clean = sec.translate(_CTRL_TRANS)
         m_num = RE_ROW_START.match(clean)
         if not m_num:
             return None
@@ -121,16 +202,23 @@ class PDFParser:
 
         specialties = []
         if after:
-            tail = RE_DATE.sub("", after).strip()
-            tail = RE_ISSN_RAW.sub("", tail).strip()
+            tail = _DATE_OR_ISSN.sub("", after).strip()
             specialties = self._split_specialties(tail)
 
-        title = re.sub(r"\s{2,}", " ", before).strip()
+        title = _MULTI_WS.sub(" ", before).strip()
         return {"N": n, "title": title, "issn": issn, "specialties": specialties}
 
-    def parse(self) -> list[dict[str, Any]]:
+    def parse(self, executor: Executor | None = None) -> list[dict[str, Any]]:
         """Read the PDF file and parses it into a list of structured records.
 
+        Page extraction and section parsing are spread over a process pool for large
+        documents; small ones are handled in the current process.
+
+        Args:
+            executor (Executor | None): Process pool to use. If None, a temporary pool
+                is created with the `spawn` start method, so a multithreaded host
+                process (such as the web server) is never forked.
+
         Returns:
             list[dict[str, Any]]: List of dictionaries, each representing a parsed journal entry.
 
@@ -139,41 +227,68 @@ class PDFParser:
         """
         if not self.path.exists():
             raise FileNotFoundError(f"Файл {self.path} не найден")
-        raw = self._read_pdf_text()
-        sections = self._split_sections(raw)
-        rows = [r for r in (self._parse_section(s) for s in sections) if r]
+
+        if executor is None:
+            # Процессы пула запускаются только при наличии работы
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context) as pool:
+                return self.parse(pool)
+
+        sections = list(self._iter_sections(self._iter_pages(executor)))
+        if len(sections) > _PARALLEL_MIN_SECTIONS:
+            parsed = executor.map(self._parse_section, sections, chunksize=_SECTIONS_CHUNKSIZE)
+        else:
+            parsed = map(self._parse_section, sections)
+        rows = [r for r in parsed if r]
         return sorted(rows, key=lambda d: d["N"])
 
 
 def save_to_json(
-    rows: list[dict[str, Any]], out_path: str | pathlib.Path | None = None
+    rows: list[dict[str, Any]],
+    out_path: str | pathlib.Path | None = None,
+    pretty: bool = False,
 ) -> pathlib.Path:
     """Save a list of dictionaries to a JSON file.
 
     If `out_path` is not provided, the file is saved as 'vak_articles.json'
-    in the current working directory.
+    in the current working directory. The data is serialized to UTF-8 bytes
+    with `orjson` and written to disk in a single call.
 
     Args:
         rows (list[dict[str, Any]]): The list of dictionaries to save.
         out_path (str | pathlib.Path | None): The path to save the JSON file to.
+        pretty (bool): Whether to indent the output with two spaces for readability.
+            Defaults to False (compact output).
 
     Returns:
         pathlib.Path: The path to the saved JSON file.
     """
     out_path = pathlib.Path(out_path or "vak_articles.json")
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(rows, f, ensure_ascii=False, indent=2)
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    out_path.write_bytes(orjson.dumps(rows, option=option))
     return out_path
 
 
 def load_json(in_path: str | pathlib.Path) -> list[dict[str, Any]]:
     """Load and parse a JSON file into a list of dictionaries.
 
+    Parsed results are cached per file and reused until the file's modification
+    time or size changes, so the returned data must not be modified in place.
+
     Args:
         in_path (str | pathlib.Path): Path to the JSON file.
 
     Returns:
         list[dict[str, Any]]: The parsed content of the JSON file.
     """
-    with in_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    in_path = pathlib.Path(in_path)
+    st = in_path.stat()
+    key, version = str(in_path.resolve()), (st.st_mtime_ns, st.st_size)
+
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = orjson.loads(in_path.read_bytes())
+    _JSON_CACHE[key] = (version, data)
+    return data
@@ -0,0 +1,23 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session() -> requests.Session:
+    """Create a `requests.Session` with a keep-alive connection pool and retries.
+
+    Reusing one session across requests to the same host skips repeated DNS lookups,
+    TCP handshakes and TLS negotiation.
+
+    Returns:
+        requests.Session: A session with an `HTTPAdapter` mounted for `http://` and `https://`.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
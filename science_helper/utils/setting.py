@@ -1,4 +1,5 @@
 import configparser
+import os
 from pathlib import Path
 import re
 
@@ -6,10 +7,22 @@ import re
 # Путь до конфигурационного файла
 CONFIG_PATH = Path("config.ini")
 
-# Чтение конфигурации
+# Чтение конфигурации (один раз на процесс)
 config = configparser.ConfigParser()
 config.read(CONFIG_PATH, encoding="utf-8")
 
+
+def get_config() -> configparser.ConfigParser:
+    """Return the configuration parsed once at import time.
+
+    The parser is kept in sync with the file by `save_config`.
+
+    Returns:
+        configparser.ConfigParser: The cached configuration.
+    """
+    return config
+
+
 # Регулярные выражения
 RE_ROW_START = re.compile(config["REGEX"]["RE_ROW_START"], re.MULTILINE)
 RE_ISSN_RAW = re.compile(config["REGEX"]["RE_ISSN_RAW"])
@@ -23,7 +36,7 @@ VAK_LIST_URL = config["WEB"]["VAK_LIST_URL"]
 SPECIALIZATION_URL = config["WEB"]["SPECIALIZATION_URL"]
 
 # Настройки админ панели
-USE_ADMIN = config["WEB.INTERFACE"]["use_admin"]
+USE_ADMIN = config["WEB.INTERFACE"].getboolean("use_admin", fallback=False)
 ADMIN_LOGIN = config["WEB.INTERFACE"]["admin_login"]
 ADMIN_PASSWORD = config["WEB.INTERFACE"]["admin_password"]
 
@@ -69,6 +82,9 @@ def save_config(config):
                     }
                 }
 
+    The file is rewritten only if the values differ from the cached configuration.
+    It is written to a temporary sibling and moved into place with `os.replace`.
+
     Raises:
         KeyError: If any of the expected keys are missing from the config.
         OSError: If writing to the configuration file fails.
@@ -102,5 +118,17 @@ def save_config(config):
         "FILENAME": config["directories"]["file_name"],
     }
 
-    with CONFIG_PATH.open("w", encoding="utf-8") as f:
+    # Параметр config скрывает модульный парсер, поэтому он берется через get_config
+    cached = get_config()
+    if config_parser == cached:
+        # Повторное сохранение без изменений не трогает файл
+        return
+
+    # Запись во временный файл и атомарная замена: файл не останется обрезанным
+    tmp_path = CONFIG_PATH.with_name(f"{CONFIG_PATH.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
         config_parser.write(f)
+    os.replace(tmp_path, CONFIG_PATH)
+
+    cached.clear()
+    cached.read_dict(config_parser)
@@ -18,13 +18,18 @@ test_img_path.mkdir(exist_ok=True)
 
 for i in range(4):
     img = Image.new("RGB", (100, 100), color=(i * 50, i * 50, i * 50))
-    img.save(test_img_path / f"img_{i}.png")
+    img.save(test_img_path / f"img_{i}.png", compress_level=1)
 
 
 def cleanup():  # noqa: D103
     shutil.rmtree(test_img_path)
 
 
+@pytest.fixture(scope="session")
+def decoded_images():  # noqa: D103
+    return [Image.open(p).copy() for p in sorted(test_img_path.glob("*.png"))]
+
+
 @pytest.fixture(scope="module")
 def image_design():  # noqa: D103
     yield ImagesDesign(
@@ -94,6 +99,23 @@ def test_united_images_grid(image_design):  # noqa: D103
     assert isinstance(img, Image.Image)
 
 
+def test_preprocessing_image_returns_new_image(image_design):  # noqa: D103
+    original = image_design[0]
+    new_img = image_design.preprocessing_image(0)
+    assert new_img is not original
+    new_img = image_design.preprocessing_image(0, width=50, height=50)
+    assert new_img is not original
+
+
+def test_united_images_keeps_stored_images_without_border(decoded_images):  # noqa: D103
+    design = ImagesDesign.from_images(
+        list(decoded_images), border_size=0, signature=True, draw_axis=True
+    )
+    before = [img.tobytes() for img in design]
+    design.united_images()
+    assert [img.tobytes() for img in design] == before
+
+
 def test_append(image_design):  # noqa: D103
     initial_len = len(image_design)
     new_img = Image.new("RGB", (100, 100), color="yellow")
@@ -101,6 +123,20 @@ def test_append(image_design):  # noqa: D103
     assert len(image_design) == initial_len + 1
 
 
+def test_clear(decoded_images):  # noqa: D103
+    design = ImagesDesign.from_images(list(decoded_images))
+    design.clear()
+    assert len(design) == 0
+
+
+def test_load_images_order(tmp_path):  # noqa: D103
+    for name, width in (("b.PNG", 2), ("c.jpg", 3), ("a.png", 1)):
+        Image.new("RGB", (width, 1)).save(tmp_path / name)
+    (tmp_path / "notes.txt").write_text("skip")
+    design = ImagesDesign(images_path=tmp_path)
+    assert [img.width for img in design] == [1, 2, 3]
+
+
 def test_invalid_signature_label():  # noqa: D103
     with pytest.raises(TypeError):
         ImagesDesign(images_path=test_img_path, signature_label=123)
@@ -111,14 +147,14 @@ def test_invalid_layout(image_design):  # noqa: D103
         image_design.united_images(layout="diagonal")
 
 
-def test_signature_label_modes():  # noqa: D103
-    design = ImagesDesign(images_path=test_img_path, signature_label="roman")
+def test_signature_label_modes(decoded_images):  # noqa: D103
+    design = ImagesDesign.from_images(list(decoded_images), signature_label="roman")
     img = design.united_images()
     assert isinstance(img, Image.Image)
 
 
-def test_axis_offset_tuple():  # noqa: D103
-    design = ImagesDesign(images_path=test_img_path, axis_offset=(20, 40))
+def test_axis_offset_tuple(decoded_images):  # noqa: D103
+    design = ImagesDesign.from_images(list(decoded_images), axis_offset=(20, 40))
     img = design.united_images()
     assert isinstance(img, Image.Image)
 
@@ -128,15 +164,15 @@ def test_repr_and_str(image_design):  # noqa: D103
     assert isinstance(str(image_design), str)
 
 
-def test_signature_label_as_tuple():  # noqa: D103
+def test_signature_label_as_tuple(decoded_images):  # noqa: D103
     labels = ("One", "Two", "Three", "Four")
-    design = ImagesDesign(images_path=test_img_path, signature_label=labels)
+    design = ImagesDesign.from_images(list(decoded_images), signature_label=labels)
     img = design.united_images()
     assert isinstance(img, Image.Image)
 
 
-def test_signature_label_single_string():  # noqa: D103
-    design = ImagesDesign(images_path=test_img_path, signature_label="Fixed")
+def test_signature_label_single_string(decoded_images):  # noqa: D103
+    design = ImagesDesign.from_images(list(decoded_images), signature_label="Fixed")
     img = design.united_images()
     assert isinstance(img, Image.Image)
 
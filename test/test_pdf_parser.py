@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from science_helper.search_vak_articles.pdf_parser import _DATE_OR_ISSN, PDFParser
+from science_helper.utils.setting import RE_DATE, RE_ISSN_RAW, RE_ROW_START
+
+
+def split_whole(pages):  # noqa: D103
+    # Прежний способ: все страницы склеиваются в одну строку и режутся по finditer
+    raw = "\n".join(pages)
+    starts = [m.start() for m in RE_ROW_START.finditer(raw)]
+    return [raw[a:b] for a, b in zip(starts, [*starts[1:], len(raw)], strict=False)]
+
+
+@pytest.fixture(scope="module")
+def parser():  # noqa: D103
+    return PDFParser("unused.pdf")
+
+
+def test_iter_sections_matches_whole_text_split(parser):  # noqa: D103
+    rnd = random.Random(0)
+    alphabet = ["1", "2", "3", ".", " ", "\n", "a", "Б", "12. ", "\n 3. x", "\n\n"]
+    for _ in range(5000):
+        text = "".join(rnd.choice(alphabet) for _ in range(rnd.randrange(40)))
+        k = min(len(text) + 1, rnd.randrange(5))
+        cuts = sorted(rnd.sample(range(len(text) + 1), k=k))
+        pages = [text[a:b] for a, b in zip([0, *cuts], [*cuts, len(text)], strict=True)]
+        assert list(parser._iter_sections(pages)) == split_whole(pages), pages
+
+
+def test_iter_sections_joins_section_across_pages(parser):  # noqa: D103
+    pages = ["1. Первый журнал", "продолжение\n2. Второй", "журнал"]
+    assert list(parser._iter_sections(pages)) == [
+        "1. Первый журнал\nпродолжение\n",
+        "2. Второй\nжурнал",
+    ]
+
+
+def test_date_or_issn_matches_sequential_cleanup():  # noqa: D103
+    rnd = random.Random(0)
+    tokens = [
+        "с 01.02.2020",
+        "C 12.12.2021",
+        "1234-5678",
+        "1234 – 567X",
+        "0000-000х",
+        "2.3.4.",
+        "Физика",
+        "x",
+    ]
+    for _ in range(2000):
+        tail = " ".join(rnd.choice(tokens) for _ in range(rnd.randrange(8)))
+        expected = RE_ISSN_RAW.sub("", RE_DATE.sub("", tail).strip()).strip()
+        assert _DATE_OR_ISSN.sub("", tail).strip() == expected, tail
@@ -1,9 +1,12 @@
+import asyncio
 import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from nicegui import ui
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 
 from science_helper.search_vak_articles import (
     bool_to_yes_no,
@@ -16,6 +19,30 @@ from science_helper.utils import setting
 temp_dir = TemporaryDirectory()
 
 
+def _write_xlsx(path: Path, rows: list[dict]) -> None:
+    # Потоковая запись строк без промежуточного DataFrame
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    if rows:
+        header = list(dict.fromkeys(k for r in rows for k in r))
+        # Оформление заголовка как в pandas 2.x: жирный шрифт, рамка, выравнивание по центру
+        bold = Font(bold=True)
+        thin = Side(style="thin")
+        border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        alignment = Alignment(horizontal="center", vertical="top")
+        cells = []
+        for name in header:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = bold
+            cell.border = border
+            cell.alignment = alignment
+            cells.append(cell)
+        ws.append(cells)
+        for r in rows:
+            ws.append([str(v) if isinstance(v, list | dict) else v for v in map(r.get, header)])
+    wb.save(path)
+
+
 def science_articles_page() -> None:  # noqa: C901, D103, PLR0915
     data_dir = Path(setting.MAIN_DIRECTORY) / setting.DATA_DIRECTORY
     required_files = [
@@ -32,30 +59,41 @@ def science_articles_page() -> None:  # noqa: C901, D103, PLR0915
         return
 
     taxonomy = json.loads(required_files[0].read_text(encoding="utf-8"))
+    # Индексы по именам; при совпадении имён побеждает первая запись, как при линейном поиске
+    cat_index: dict[str, dict] = {}
+    sub_index: dict[tuple[str, str], dict] = {}
+    for c in taxonomy:
+        cat_index.setdefault(c["category_name"], c)
+    for name, c in cat_index.items():
+        for s in c["sub_category"]:
+            sub_index.setdefault((name, s["subcategory_name"]), s)
+
     def get_cat():
         return ["Выбрать..."] + [c["category_name"] for c in taxonomy]
     def get_sub(c):
         return ["Выбрать..."] + [
-            s["subcategory_name"]
-            for s in next((x for x in taxonomy if x["category_name"] == c["label"]), {}).get(
-                "sub_category", []
-            )
+            s["subcategory_name"] for s in cat_index.get(c["label"], {}).get("sub_category", [])
         ]
 
     def get_specs(cat, sub):
-        c = next((x for x in taxonomy if x["category_name"] == cat["label"]), None)
-        sub = (
-            next((s for s in c["sub_category"] if s["subcategory_name"] == sub["label"]), None)
-            if c
-            else None
-        )
+        sub = sub_index.get((cat["label"], sub["label"]))
         return sub["values"] if sub else []
 
     def codes(selected):
         return sorted({".".join(s["label"].split(".")[:3]) for s in selected})
 
     def stringify_lists(rows):
-        return [{k: ", ".join(v) if isinstance(v, list) else v for k, v in r.items()} for r in rows]
+        if not rows:
+            return []
+        # Схема строк одинакова, поэтому списочные поля определяются по первой строке
+        list_keys = [k for k, v in rows[0].items() if isinstance(v, list)]
+        out = []
+        for r in rows:
+            row = dict(r)
+            for k in list_keys:
+                row[k] = ", ".join(row[k])
+            out.append(row)
+        return out
 
     with ui.column().classes("w-full items-center gap-4"):
         ui.label("Анализ научных журналов").classes("text-xl")
@@ -105,9 +143,14 @@ def science_articles_page() -> None:  # noqa: C901, D103, PLR0915
             vak_filters = filter_rows_by_specialty(vak_articles, codes(specs_selected))
             whitelist = load_json(data_dir / "whitelist_articles.json")
 
+            issn_index = {}
+            for w in whitelist:
+                for issn in w["issns"]:
+                    issn_index.setdefault(issn, w)
+
             data = []
             for it in vak_filters:
-                hit = next((w for w in whitelist if it["issn"] in w["issns"]), None)
+                hit = issn_index.get(it["issn"])
                 if hit:
                     data.append(
                         {
@@ -126,9 +169,13 @@ def science_articles_page() -> None:  # noqa: C901, D103, PLR0915
             xlsx_data = xlsx_dir / "data.xlsx"
             xlsx_filters = xlsx_dir / "filters.xlsx"
             xlsx_articles = xlsx_dir / "articles.xlsx"
-            pd.DataFrame(data).to_excel(xlsx_data, index=False)
-            pd.DataFrame(vak_filters).to_excel(xlsx_filters, index=False)
-            pd.DataFrame(vak_articles).to_excel(xlsx_articles, index=False)
+            # Файлы пишутся в потоках, не блокируя цикл событий NiceGUI
+            exports = (
+                (xlsx_data, data),
+                (xlsx_filters, vak_filters),
+                (xlsx_articles, vak_articles),
+            )
+            await asyncio.gather(*(asyncio.to_thread(_write_xlsx, p, rows) for p, rows in exports))
 
             # Определения колонок
             cols_data = [
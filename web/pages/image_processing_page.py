@@ -1,10 +1,12 @@
-import base64
+import asyncio
+from functools import cache
 import io
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from nicegui import ui
-from PIL import Image
+from fastapi import Response
+from nicegui import app, ui
+from PIL import Image, features
 
 from science_helper.image_processing import (
     DrawioImageDesign,
@@ -27,19 +29,87 @@ united_params = {
 
 united_controls = {}
 
-valid_layouts = set([mode.value for mode in LayoutMode])
+valid_layouts = {mode.value for mode in LayoutMode}
 
 tmp_dir = TemporaryDirectory()
 design = ImagesDesign(images_path=tmp_dir.name)
 
 font_dir = Path("./fonts")
-font_files = sorted([f.stem for f in font_dir.glob("*.ttf") if f.is_file()])
+
+
+@cache
+def _font_files() -> list[str]:
+    return sorted(f.stem for f in font_dir.glob("*.ttf") if f.is_file())
+
+
 signature_label_options = [mode.value for mode in LabelMode]
 signature_pos_options = [mode.value for mode in SignaturePosition]
 
-download_link = ui.html("").classes("hidden")
 download_drawio_link = ui.html("").classes("hidden")
 
+# Атрибуты ImagesDesign, которые меняются из интерфейса
+_DESIGN_ATTRS = (
+    "border_size",
+    "border_fill",
+    "signature",
+    "signature_label",
+    "signature_label_color",
+    "signature_pos",
+    "signature_size",
+    "signature_color",
+    "signature_font_size",
+    "draw_axis",
+    "axis_labels",
+    "axis_offset",
+    "axis_length",
+    "axis_width",
+    "axis_font_size",
+    "font_family",
+)
+
+# Превью не обязано быть без потерь: WebP кодируется заметно быстрее PNG.
+# Для изображений больше предела WebP используется JPEG
+_WEBP_MAX_SIZE = 16383
+_WEBP_PREVIEW = ({"format": "WEBP", "quality": 80}, "image/webp")
+_JPEG_PREVIEW = ({"format": "JPEG", "quality": 85}, "image/jpeg")
+_HAS_WEBP = features.check("webp")
+
+# Последнее превью: ключ параметров, итоговое изображение, байты превью, MIME-тип,
+# закодированный по запросу PNG и версия
+_preview = {"key": None, "image": None, "data": None, "mime": None, "png": None, "version": 0}
+
+_NO_STORE = {"Cache-Control": "no-store"}
+
+# Отложенная перерисовка: серия изменений подряд даёт одну перерисовку.
+# Поколение растёт при загрузке и очистке изображений, чтобы отбросить
+# результат отрисовки, начатой до этого
+_UPDATE_DELAY = 0.25
+_pending = {"timer": None, "busy": False, "dirty": False, "generation": 0}
+
+
+@app.get("/preview/current")
+def _serve_preview() -> Response:
+    if _preview["data"] is None:
+        return Response(status_code=404)
+    return Response(_preview["data"], media_type=_preview["mime"], headers=_NO_STORE)
+
+
+def _encode_png(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _preview_png() -> bytes:
+    # PNG без потерь кодируется только при скачивании и один раз на версию превью
+    image, png = _preview["image"], _preview["png"]
+    if png is None:
+        png = _encode_png(image)
+        # Превью могло смениться, пока шло кодирование
+        if _preview["image"] is image:
+            _preview["png"] = png
+    return png
+
 
 def image_processing_page():  # noqa: D103, PLR0915
     with ui.column().classes("w-full items-center justify-center gap-4"):
@@ -48,7 +118,7 @@ def image_processing_page():  # noqa: D103, PLR0915
         with ui.dialog() as upload_dialog, ui.card().classes("p-6"):
             ui.label("Загрузить изображения").classes("text-lg font-semibold")
             ui.upload(
-                on_upload=lambda e: handle_upload(e, upload_dialog, image_slot, download_link),
+                on_upload=lambda e: handle_upload(e, upload_dialog, image_slot),
                 auto_upload=True,
                 multiple=True,
                 max_file_size=5 * 1024 * 1024,
@@ -67,7 +137,6 @@ def image_processing_page():  # noqa: D103, PLR0915
                 "color=accent"
             ).bind_visibility_from(image_slot, "visible")
 
-        download_link  # noqa: B018
         download_drawio_link  # noqa: B018
 
         with ui.expansion("Параметры обработки", icon="settings"):
@@ -90,7 +159,7 @@ def image_processing_page():  # noqa: D103, PLR0915
                     "Размер рамки",
                     value=str(design.border_size),
                     on_change=lambda e: update_param("border_size", safe_int(e.value), image_slot),
-                ).props("type=number min=0")
+                ).props("type=number min=0 debounce=300")
                 ui.color_input(
                     label="Цвет рамки",
                     value="#000000",
@@ -125,14 +194,14 @@ def image_processing_page():  # noqa: D103, PLR0915
                     on_change=lambda e: update_param(
                         "signature_size", (safe_int(e.value), design.signature_size[1]), image_slot
                     ),
-                ).props("type=number min=0")
+                ).props("type=number min=0 debounce=300")
                 ui.input(
                     "Размер подписи (высота)",
                     value=str(design.signature_size[1]),
                     on_change=lambda e: update_param(
                         "signature_size", (design.signature_size[0], safe_int(e.value)), image_slot
                     ),
-                ).props("type=number min=0")
+                ).props("type=number min=0 debounce=300")
                 ui.color_input(
                     label="Цвет подписи (фон)",
                     value="#000",
@@ -144,7 +213,7 @@ def image_processing_page():  # noqa: D103, PLR0915
                     on_change=lambda e: update_param(
                         "signature_font_size", safe_int(e.value), image_slot
                     ),
-                ).props("type=number min=3")
+                ).props("type=number min=3 debounce=300")
 
                 ui.checkbox(
                     "Показывать оси",
@@ -157,14 +226,14 @@ def image_processing_page():  # noqa: D103, PLR0915
                     if isinstance(design.axis_labels[0], str)
                     else ",".join(design.axis_labels[0]),
                     on_change=lambda e: update_axis_labels("x", e.value, image_slot),
-                )
+                ).props("debounce=300")
                 ui.input(
                     "Подписи оси Y",
                     value=design.axis_labels[1]
                     if isinstance(design.axis_labels[1], str)
                     else ",".join(design.axis_labels[1]),
                     on_change=lambda e: update_axis_labels("y", e.value, image_slot),
-                )
+                ).props("debounce=300")
                 ui.input(
                     "Смещение по X",
                     value=str(
@@ -173,7 +242,7 @@ def image_processing_page():  # noqa: D103, PLR0915
                         else design.axis_offset
                     ),
                     on_change=lambda e: update_axis_offset("x", e.value, image_slot),
-                ).props("type=number min=0")
+                ).props("type=number min=0 debounce=300")
                 ui.input(
                     "Смещение по Y",
                     value=str(
@@ -182,26 +251,26 @@ def image_processing_page():  # noqa: D103, PLR0915
                         else design.axis_offset
                     ),
                     on_change=lambda e: update_axis_offset("y", e.value, image_slot),
-                ).props("type=number min=0")
+                ).props("type=number min=0 debounce=300")
                 ui.input(
                     "Длина осей",
                     value=str(design.axis_length),
                     on_change=lambda e: update_param("axis_length", safe_int(e.value), image_slot),
-                ).props("type=number min=1")
+                ).props("type=number min=1 debounce=300")
                 ui.input(
                     "Толщина осей",
                     value=str(design.axis_width),
                     on_change=lambda e: update_param("axis_width", safe_int(e.value), image_slot),
-                ).props("type=number min=1")
+                ).props("type=number min=1 debounce=300")
                 ui.input(
                     "Размер шрифта осей",
                     value=str(design.axis_font_size),
                     on_change=lambda e: update_param(
                         "axis_font_size", safe_int(e.value), image_slot
                     ),
-                ).props("type=number min=3")
+                ).props("type=number min=3 debounce=300")
                 ui.select(
-                    font_files or ["Arial"],
+                    _font_files() or ["Arial"],
                     value=design.font_family,
                     label="Шрифт",
                     on_change=lambda e: update_param("font_family", e.value, image_slot),
@@ -278,7 +347,7 @@ def update_axis_offset(axis: str, value: str, image_slot):  # noqa: D103
         ui.notify(f"Смещение по оси {axis.upper()} должно быть числом", type="warning")
 
 
-def update_axis_labels(axis: str, text: str, image_slot):  # noqa: D103
+async def update_axis_labels(axis: str, text: str, image_slot):  # noqa: D103
     try:
         values = [v.strip() for v in text.split(",") if v.strip()]
         if not values:
@@ -300,33 +369,38 @@ def update_axis_labels(axis: str, text: str, image_slot):  # noqa: D103
         else:
             design.axis_labels = (current_x, parsed_value)
 
-        update_output(image_slot)
+        await update_output(image_slot)
     except Exception as ex:
         ui.notify(f"Ошибка при установке подписей осей: {ex}", type="negative")
 
 
-def handle_upload(e, dialog, image_slot, download_link):  # noqa: D103
+def handle_upload(e, dialog, image_slot):  # noqa: D103
     allowed_ext = (".png", ".jpg", ".jpeg")
     if not e.name.lower().endswith(allowed_ext):
         ui.notify("Неподдерживаемый формат", type="negative")
         return
     e.content.seek(0)
-    img = Image.open(io.BytesIO(e.content.read())).convert("RGB")
+    # convert() декодирует изображение сразу, пока файл загрузки ещё открыт
+    img = Image.open(e.content).convert("RGB")
     design.append(img)
+    _pending["generation"] += 1
+    _preview["key"] = None
     ui.notify(f"{e.name} загружен", type="positive")
     dialog.close()
-    update_output(image_slot)
+    _schedule_update(image_slot)
 
 
 def clear_images(image_slot):  # noqa: D103
-    design._images.clear()
+    design.clear()
+    _pending["generation"] += 1
+    _preview.update(key=None, image=None, data=None, png=None)
     image_slot.set_source("")
     ui.notify("Изображения очищены", type="info")
 
 
 def update_param(name, value, image_slot):  # noqa: D103
     setattr(design, name, value)
-    update_output(image_slot)
+    _schedule_update(image_slot)
 
 
 def update_united(name, value, image_slot):  # noqa: D103
@@ -338,82 +412,111 @@ def update_united(name, value, image_slot):  # noqa: D103
             return
     united_params[name] = value
     if len(design) > 1:
-        update_output(image_slot)
+        _schedule_update(image_slot)
 
 
-def update_output(image_slot):  # noqa: D103
-    if not len(design):
-        return
-    result = design.united_images(
-        layout=united_params["layout"],
-        spacing=united_params["spacing"],
-        bg_color=united_params["bg_color"],
-        grid_cols=united_params["grid_cols"],
-        grid_rows=united_params["grid_rows"],
-        width=united_params["width"],
-        height=united_params["height"],
+def _preview_key():
+    return (
+        len(design),
+        # Ключи united_params и их порядок фиксированы, достаточно значений
+        tuple(united_params.values()),
+        tuple(getattr(design, name) for name in _DESIGN_ATTRS),
     )
+
+
+def _schedule_update(image_slot):
+    if _pending["timer"] is not None:
+        _pending["timer"].cancel()
+    _pending["timer"] = ui.timer(_UPDATE_DELAY, lambda: update_output(image_slot), once=True)
+
+
+def _snapshot(cls=ImagesDesign):
+    # Копия списка изображений и параметров: фоновая отрисовка не видит
+    # загрузок, очистки и правок, сделанных во время неё
+    copy = cls(images_path=tmp_dir.name)
+    copy._images = design._images.copy()
+
+    # Копирование через сеттеры: классы используют __slots__, значения проверяются
+    for name in _DESIGN_ATTRS:
+        setattr(copy, name, getattr(design, name))
+    return copy
+
+
+def _render_composite(snapshot, params):
+    # Ключи united_params повторяют имена аргументов united_images
+    return snapshot.united_images(**params)
+
+
+def _render_preview(snapshot, params):
+    result = _render_composite(snapshot, params)
+    use_webp = _HAS_WEBP and max(result.size) <= _WEBP_MAX_SIZE
+    save_kwargs, mime = _WEBP_PREVIEW if use_webp else _JPEG_PREVIEW
     buffer = io.BytesIO()
-    result.save(buffer, format="PNG")
-    buffer.seek(0)
-    b64 = base64.b64encode(buffer.getvalue()).decode()
-    image_slot.set_source(f"data:image/png;base64,{b64}")
-    download_link.set_content(f"""
-        <a id="download_result" download="result.png" href="data:image/png;base64,{b64}"></a>
-    """)
+    result.save(buffer, **save_kwargs)
+    return result, buffer.getvalue(), mime
+
+
+async def update_output(image_slot):  # noqa: D103
+    if not len(design):
+        return
+    key = _preview_key()
+    if key == _preview["key"]:
+        # Параметры не изменились: на странице уже показан актуальный результат
+        return
+    if _pending["busy"]:
+        # Отрисовка уже идёт в фоне; повторим её после завершения
+        _pending["dirty"] = True
+        return
 
+    generation = _pending["generation"]
+    snapshot, params = _snapshot(), dict(united_params)
+    _pending["busy"] = True
+    try:
+        # Компоновка и кодирование выполняются вне цикла событий
+        result, data, mime = await asyncio.to_thread(_render_preview, snapshot, params)
+    finally:
+        _pending["busy"] = False
+
+    # Пока шла отрисовка, изображения могли загрузить или очистить
+    if generation == _pending["generation"] and len(design):
+        _preview.update(key=key, image=result, data=data, mime=mime, png=None)
+        # Версия в адресе заставляет браузер перезапросить изображение
+        _preview["version"] += 1
+        image_slot.set_source(f"/preview/current?v={_preview['version']}")
+
+    if _pending["dirty"]:
+        _pending["dirty"] = False
+        await update_output(image_slot)
 
-def download_png():  # noqa: D103
+
+async def download_png():  # noqa: D103
     if not len(design):
         ui.notify("Нет изображений для сохранения", type="warning")
         return
 
     try:
-        result = design.united_images(
-            layout=united_params["layout"],
-            spacing=united_params["spacing"],
-            bg_color=united_params["bg_color"],
-            grid_cols=united_params["grid_cols"],
-            grid_rows=united_params["grid_rows"],
-            width=united_params["width"],
-            height=united_params["height"],
-        )
-        output_path = Path(tmp_dir.name) / "result.png"
-        result.save(output_path, format="PNG")
-        ui.download(str(output_path), filename="result.png")
+        if _preview["image"] is not None and _preview_key() == _preview["key"]:
+            # Превью актуально: повторно используем закодированный PNG
+            png = await asyncio.to_thread(_preview_png)
+        else:
+            result = await asyncio.to_thread(_render_composite, _snapshot(), dict(united_params))
+            png = await asyncio.to_thread(_encode_png, result)
+        # Файл отдается из памяти, поэтому сессии не перезаписывают результаты друг друга
+        ui.download(png, filename="result.png", media_type="image/png")
     except Exception as e:
         ui.notify(f"Ошибка при сохранении PNG: {e}", type="negative")
 
 
-def download_drawio():  # noqa: D103
+async def download_drawio():  # noqa: D103
     if not len(design):
         ui.notify("Нет изображений для сохранения", type="warning")
         return
     try:
-        drawio = DrawioImageDesign(images_path=tmp_dir.name)
-        drawio._images = design._images.copy()
-
-        drawio.border_size = design.border_size
-        drawio.border_fill = design.border_fill
-        drawio.signature = design.signature
-        drawio.signature_label = design.signature_label
-        drawio.signature_label_color = design.signature_label_color
-        drawio.signature_color = design.signature_color
-        drawio.signature_font_size = design.signature_font_size
-        drawio.signature_size = design.signature_size
-        drawio.signature_pos = design.signature_pos
-        drawio.axis_labels = design.axis_labels
-        drawio.axis_length = design.axis_length
-        drawio.axis_width = design.axis_width
-        drawio.axis_font_size = design.axis_font_size
-        drawio.axis_offset = design.axis_offset
-        drawio.font_family = design.font_family
-        drawio.draw_axis = design.draw_axis
-
-        output_path = Path(tmp_dir.name) / "result.drawio"
-
-        drawio.export_to_drawio(
-            file=output_path,
+        drawio = _snapshot(DrawioImageDesign)
+        buffer = io.BytesIO()
+        await asyncio.to_thread(
+            drawio.export_to_drawio,
+            file=buffer,
             layout=united_params["layout"],
             spacing=united_params["spacing"],
             grid_cols=united_params["grid_cols"],
@@ -422,6 +525,6 @@ def download_drawio():  # noqa: D103
             height=united_params["height"],
         )
 
-        ui.download(str(output_path), filename="result.drawio")
+        ui.download(buffer.getvalue(), filename="result.drawio", media_type="application/xml")
     except Exception as e:
         ui.notify(f"Ошибка при сохранении drawio: {e}", type="negative")
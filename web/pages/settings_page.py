@@ -1,4 +1,7 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
 from pathlib import Path
 
 from nicegui import ui
@@ -23,6 +26,12 @@ save_btn: ui.button | None = None
 spec_btn: ui.button | None = None
 download_btn: ui.button | None = None
 
+# Общий пул для разбора HTML и PDF. Процессы запускаются через spawn: fork многопоточного
+# сервера может зависнуть на блокировках, захваченных другими потоками
+_process_pool = ProcessPoolExecutor(
+    max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+)
+
 
 def _toggle_buttons(state: bool) -> None:
     for btn in (save_btn, spec_btn, download_btn):
@@ -51,10 +60,15 @@ def admin_setting(state: bool) -> None:  # noqa: D103
 async def on_load_specializations(update_data_status: callable, refresh_analysis: callable) -> None:  # noqa: D103
     _toggle_buttons(False)
     try:
-        parser = NomenclatureParser()
-        specializations = await asyncio.to_thread(
-            parser.get_specialties, setting.SPECIALIZATION_URL
-        )
+        with NomenclatureParser() as parser:
+            html = await asyncio.to_thread(parser.fetch_html, setting.SPECIALIZATION_URL)
+        specializations = []
+        if html is not None:
+            # Разбор HTML держит GIL, поэтому выполняется в отдельном процессе
+            loop = asyncio.get_running_loop()
+            specializations = await loop.run_in_executor(
+                _process_pool, NomenclatureParser.parse_specialties, html
+            )
         out_path = (
             Path(setting.MAIN_DIRECTORY) / setting.DATA_DIRECTORY / setting.SPECIALIZATION_NAME
         )
@@ -66,18 +80,27 @@ async def on_load_specializations(update_data_status: callable, refresh_analysis
         _toggle_buttons(True)
 
 
+def _download_sources(out_path: Path) -> Path:
+    # Загрузчик целиком работает в отдельном потоке, где запущен собственный цикл событий:
+    # чтение конфигурации, запись файлов и сохранение настроек не блокируют интерфейс
+    with PDFDownloader(output_dir=out_path, config_path="config.ini") as downloader:
+        # PDF и белый список загружаются параллельно в одной HTTP-сессии
+        (vak_path,) = asyncio.run(
+            downloader.download_many(
+                [setting.VAK_LIST_URL],
+                json_sources={"whitelist_articles.json": setting.WHITE_LIST_URL},
+            )
+        )
+    return vak_path
+
+
 async def _download_and_parse_pdf() -> str | None:
     out_path = Path(setting.MAIN_DIRECTORY) / setting.DATA_DIRECTORY
-    downloader = PDFDownloader(output_dir=out_path, config_path="config.ini")
-
-    vak_path = await asyncio.to_thread(downloader.download_pdf_if_needed, setting.VAK_LIST_URL)
+    vak_path = await asyncio.to_thread(_download_sources, out_path)
     if vak_path and vak_path.is_file():
         parser = PDFParser(vak_path)
-        parsed_data = await asyncio.to_thread(parser.parse)
-        save_to_json(parsed_data, out_path / "vak_articles.json")
-        await asyncio.to_thread(
-            downloader.dict_from_web, setting.WHITE_LIST_URL, "whitelist_articles.json"
-        )
+        parsed_data = await asyncio.to_thread(parser.parse, _process_pool)
+        await asyncio.to_thread(save_to_json, parsed_data, out_path / "vak_articles.json")
         return vak_path.name
     return None
 
@@ -92,6 +115,8 @@ async def on_download_pdf(update_data_status: callable, refresh_analysis: callab
             refresh_analysis()
         else:
             ui.notify("Файл PDF не найден или недоступен", timeout=10)
+    except Exception as e:
+        ui.notify(f"Ошибка загрузки журналов: {e}", type="negative", timeout=10)
     finally:
         _toggle_buttons(True)
 
@@ -118,14 +143,13 @@ def settings_page(update_data_status: callable, refresh_analysis: callable) -> N
                     "Ссылка на специализации", value=setting.SPECIALIZATION_URL
                 ).classes("w-full")
 
-                state = setting.USE_ADMIN.strip().lower() == "true"
                 use_admin_checkbox = ui.checkbox(
                     "Использовать админ панель?",
-                    value=state,
+                    value=setting.USE_ADMIN,
                     on_change=lambda e: admin_setting(e.value),
                 ).classes("w-full")
                 admin_container = ui.column().classes("gap-2 mt-2")
-                admin_setting(state)
+                admin_setting(setting.USE_ADMIN)
 
             with ui.column().classes("w-1/4"):
                 ui.label("Настройки директории").classes("text-lg font-bold")